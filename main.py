@@ -4,6 +4,8 @@ from datetime import date
 import requests
 
 import devconf
+import merge
+import pentabarf
 import sessionize
 
 
@@ -43,6 +45,8 @@ def main():
     )
 
     for config in [devconf_2022, devconf_2023]:
+        paths = []
+
         for event_config in config.events:
             event = devconf.get_event(
                 config,
@@ -51,12 +55,19 @@ def main():
             out = devconf.event_to_pentabarf(event)
 
             loc = event_config.name.lower().replace(" ", "-")
-            with open(
-                f"schedules/devconf-{event_config.day.year}-{loc}.pentabarf.xml",
-                "w",
-            ) as f:
+            path = f"schedules/devconf-{event_config.day.year}-{loc}.pentabarf.xml"
+            with open(path, "w") as f:
                 f.write(out.to_xml())
 
+            paths.append(path)
+
+        year = config.events[0].day.year
+        with open(f"schedules/devconf-{year}.pentabarf.xml", "w") as f:
+            feeds = [pentabarf.iterparse(path) for path in paths]
+            merge.write_pentabarf(feeds, f, title=f"DevConf {year}")
+        with open(f"schedules/devconf-{year}.xcal.xml", "w") as f:
+            merge.write_xcal([pentabarf.iterparse(path) for path in paths], f)
+
 
 if __name__ == "__main__":
     main()
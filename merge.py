@@ -0,0 +1,136 @@
+import heapq
+from datetime import date, datetime
+from typing import Iterator, List, Optional, TextIO, Tuple
+from xml.etree import ElementTree
+from xml.sax.saxutils import quoteattr
+
+import pentabarf
+
+Feed = Tuple[pentabarf.Conference, Iterator[Tuple[date, str, pentabarf.Event]]]
+MergeKey = Tuple[date, str, datetime]
+
+
+def room_name(conference: pentabarf.Conference, room: str) -> str:
+    # Rooms are only unique within a single venue, so qualify them by city
+    if not room:
+        return conference.city
+    return f"{conference.city}: {room}"
+
+
+def event_id(conference: pentabarf.Conference, event: pentabarf.Event) -> str:
+    # Talks can be given in several cities and break IDs are hashes of their
+    # title, so qualify IDs by city and start time to keep them unique
+    city = conference.city.lower().replace(" ", "-")
+    return f"{city}-{event.start.strftime('%Y%m%dT%H%M')}-{event.id}"
+
+
+def _feed(feed: Feed) -> Iterator[Tuple[MergeKey, pentabarf.Event]]:
+    conference, events = feed
+    _check_city(conference)
+    previous: Optional[MergeKey] = None
+
+    for d, room, event in events:
+        name = room_name(conference, room)
+        key = (d, name, event.start)
+        if previous is not None and key < previous:
+            raise ValueError(
+                f"{conference.city} is not sorted by day, room and start time"
+                f" at event {event.id}"
+            )
+        previous = key
+
+        yield key, event.copy(update={"id": event_id(conference, event), "room": name})
+
+
+def merge_events(feeds: List[Feed]) -> Iterator[Tuple[date, pentabarf.Event]]:
+    """
+    Lazily merges the events of several feeds ordered by day, room and start
+    time. Each feed must already be in that order, so only one pending event per
+    feed is held at a time; a ValueError is raised if a feed goes backwards.
+    """
+    for (d, _, _), event in heapq.merge(
+        *(_feed(feed) for feed in feeds), key=lambda item: item[0]
+    ):
+        yield d, event
+
+
+def merge_conference(
+    conferences: List[pentabarf.Conference], title: str
+) -> pentabarf.Conference:
+    if not conferences:
+        raise ValueError("no feeds to merge")
+    for conference in conferences:
+        _check_city(conference)
+
+    return pentabarf.Conference(
+        title=title,
+        city=", ".join(conference.city for conference in conferences),
+        venue="",
+        start=min(conference.start for conference in conferences),
+        end=max(conference.end for conference in conferences),
+    )
+
+
+def write_pentabarf(feeds: List[Feed], f: TextIO, title: str) -> None:
+    conference = merge_conference([conference for conference, _ in feeds], title)
+
+    f.write("<schedule>\n")
+    _write_element(f, conference.to_element(), 1)
+
+    index = 0
+    current_day = None
+    current_room = None
+
+    for d, event in merge_events(feeds):
+        if current_room is not None and (
+            d != current_day or event.room != current_room
+        ):
+            f.write("\t\t</room>\n")
+            current_room = None
+
+        if d != current_day:
+            if current_day is not None:
+                f.write("\t</day>\n")
+            index += 1
+            current_day = d
+            f.write(f'\t<day index="{index}" date="{d.strftime("%Y-%m-%d")}">\n')
+
+        if current_room is None:
+            current_room = event.room
+            f.write(f"\t\t<room name={quoteattr(current_room)}>\n")
+
+        _write_element(f, event.to_element(current_room), 3)
+
+    if current_room is not None:
+        f.write("\t\t</room>\n")
+    if current_day is not None:
+        f.write("\t</day>\n")
+    f.write("</schedule>")
+
+
+def write_xcal(feeds: List[Feed], f: TextIO) -> None:
+    f.write(
+        '<iCalendar xmlns:xCal="urn:ietf:params:xml:ns:xcal"'
+        ' xmlns:pentabarf="http://pentabarf.org">\n'
+    )
+    f.write("\t<vcalendar>\n")
+    f.write("\t\t<version>2.0</version>\n")
+
+    for _, event in merge_events(feeds):
+        _write_element(f, event.to_vevent(), 2)
+
+    f.write("\t</vcalendar>\n")
+    f.write("</iCalendar>")
+
+
+def _check_city(conference: pentabarf.Conference) -> None:
+    # Room names and IDs are qualified by city, so it has to be set
+    if not conference.city:
+        raise ValueError(f"cannot merge {conference.title or 'feed'} without a city")
+
+
+def _write_element(f: TextIO, element: ElementTree.Element, level: int) -> None:
+    ElementTree.indent(element, space="\t", level=level)
+    f.write("\t" * level)
+    f.write(ElementTree.tostring(element, encoding="unicode"))
+    f.write("\n")
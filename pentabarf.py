@@ -1,9 +1,15 @@
 from datetime import date, datetime, timedelta
-from typing import List, Optional
+from typing import IO, Iterator, List, Optional, Tuple, Union
 from xml.etree import ElementTree
 
 from pydantic import BaseModel
 
+from util import (
+    pentabarf_format_duration,
+    pentabarf_parse_duration,
+    xcal_format_duration,
+)
+
 
 class Event(BaseModel):
     id: str
@@ -16,11 +22,56 @@ class Event(BaseModel):
     language: str
     persons: List[str]
 
+    def to_element(self, room: str) -> ElementTree.Element:
+        e = ElementTree.Element("event", attrib={"id": str(self.id)})
+        ElementTree.SubElement(e, "start").text = self.start.strftime("%H:%M")
+        ElementTree.SubElement(e, "duration").text = pentabarf_format_duration(
+            self.duration
+        )
+        ElementTree.SubElement(e, "room").text = room
+        ElementTree.SubElement(e, "title").text = self.title
+        ElementTree.SubElement(e, "description").text = self.description
+        if self.track:
+            ElementTree.SubElement(e, "track").text = self.track
+        ElementTree.SubElement(e, "language").text = self.language
+
+        persons = ElementTree.SubElement(e, "persons")
+        for person in self.persons:
+            ElementTree.SubElement(persons, "person").text = person
+        return e
+
+    def to_vevent(self) -> ElementTree.Element:
+        ends_at = self.start + self.duration
+
+        vevent = ElementTree.Element("vevent")
+        ElementTree.SubElement(vevent, "uid").text = str(self.id)
+        ElementTree.SubElement(vevent, "dtstart").text = self.start.strftime(
+            "%Y%m%dT%H%M%S"
+        )
+        ElementTree.SubElement(vevent, "dtend").text = ends_at.strftime("%Y%m%dT%H%M%S")
+        ElementTree.SubElement(vevent, "summary").text = self.title
+        ElementTree.SubElement(vevent, "description").text = self.description
+        ElementTree.SubElement(vevent, "location").text = self.room
+        ElementTree.SubElement(vevent, "duration").text = xcal_format_duration(
+            self.start, ends_at
+        )
+
+        for person in self.persons:
+            ElementTree.SubElement(vevent, "attendee").text = person
+
+        return vevent
+
 
 class Room(BaseModel):
     name: str
     events: List[Event]
 
+    def to_element(self) -> ElementTree.Element:
+        room = ElementTree.Element("room", attrib={"name": self.name})
+        for event in self.events:
+            room.append(event.to_element(self.name))
+        return room
+
 
 class Day(BaseModel):
     date: date
@@ -35,6 +86,20 @@ class Conference(BaseModel):
     start: date
     end: date
 
+    def to_element(self) -> ElementTree.Element:
+        conference = ElementTree.Element("conference")
+        ElementTree.SubElement(conference, "title").text = self.title
+        ElementTree.SubElement(conference, "city").text = self.city
+
+        if self.venue:
+            ElementTree.SubElement(conference, "venue").text = self.venue
+
+        ElementTree.SubElement(conference, "start").text = self.start.strftime(
+            "%Y-%m-%d"
+        )
+        ElementTree.SubElement(conference, "end").text = self.end.strftime("%Y-%m-%d")
+        return conference
+
 
 class Schedule(BaseModel):
     conference: Conference
@@ -42,19 +107,7 @@ class Schedule(BaseModel):
 
     def to_xml(self) -> str:
         root = ElementTree.Element("schedule")
-        conference = ElementTree.SubElement(root, "conference")
-        ElementTree.SubElement(conference, "title").text = self.conference.title
-        ElementTree.SubElement(conference, "city").text = self.conference.city
-
-        if self.conference.venue:
-            ElementTree.SubElement(conference, "venue").text = self.conference.venue
-
-        ElementTree.SubElement(
-            conference, "start"
-        ).text = self.conference.start.strftime("%Y-%m-%d")
-        ElementTree.SubElement(conference, "end").text = self.conference.end.strftime(
-            "%Y-%m-%d"
-        )
+        root.append(self.conference.to_element())
 
         for i, d in enumerate(sorted(self.days, key=lambda d: d.date)):
             day = ElementTree.SubElement(
@@ -64,40 +117,150 @@ class Schedule(BaseModel):
             )
 
             for r in sorted(d.rooms, key=lambda r: r.name):
-                room = ElementTree.SubElement(day, "room", attrib={"name": r.name})
-
-                for event in r.events:
-                    e = ElementTree.SubElement(
-                        room, "event", attrib={"id": str(event.id)}
-                    )
-                    ElementTree.SubElement(e, "start").text = event.start.strftime(
-                        "%H:%M"
-                    )
-                    ElementTree.SubElement(e, "duration").text = self._format_duration(
-                        event.duration
-                    )
-                    ElementTree.SubElement(e, "room").text = r.name
-                    ElementTree.SubElement(e, "title").text = event.title
-                    ElementTree.SubElement(e, "description").text = event.description
-                    if event.track:
-                        ElementTree.SubElement(e, "track").text = event.track
-                    ElementTree.SubElement(e, "language").text = event.language
-
-                    persons = ElementTree.SubElement(e, "persons")
-                    for person in event.persons:
-                        ElementTree.SubElement(persons, "person").text = person
+                day.append(r.to_element())
 
         ElementTree.indent(root, space="\t", level=0)
         return ElementTree.tostring(root, encoding="unicode")
 
-    @staticmethod
-    def _format_duration(duration: timedelta) -> str:
-        seconds = int(duration.total_seconds())
 
-        hours = seconds // (60 * 60)
-        seconds = seconds % (60 * 60)
+def load(source: Union[str, IO]) -> Schedule:
+    """
+    Loads a schedule written by `Schedule.to_xml`. The file is stream parsed and
+    each element is cleared once it has been read, so only the resulting models
+    are kept in memory.
+
+    Writing the result with `to_xml` reproduces the file exactly, unless it
+    contains raw carriage returns: XML parsers normalise those to newlines, so
+    schedules should use plain newlines (as `event_to_pentabarf` produces).
+    """
+    conference: Optional[Conference] = None
+    days: List[Day] = []
+    rooms: List[Room] = []
+    events: List[Event] = []
+    day: Optional[date] = None
+    room = ""
+    in_event = False
+
+    context = ElementTree.iterparse(source, events=("start", "end"))
+    _, root = next(context)
+
+    for action, elem in context:
+        if action == "start":
+            if elem.tag == "day":
+                day = date.fromisoformat(elem.attrib["date"])
+            elif elem.tag == "room" and not in_event:
+                room = elem.attrib["name"]
+            elif elem.tag == "event":
+                in_event = True
+            continue
+
+        if in_event and elem.tag != "event":
+            # Read in one go once the whole event has been parsed
+            continue
+
+        if elem.tag == "conference":
+            conference = _parse_conference(elem)
+            root.clear()
+        elif elem.tag == "event":
+            if day is None:
+                raise Exception("event outside of a day")
+            events.append(_parse_event(elem, day, room))
+            elem.clear()
+            in_event = False
+        elif elem.tag == "room":
+            rooms.append(Room(name=room, events=events))
+            events = []
+            elem.clear()
+        elif elem.tag == "day":
+            if day is None:
+                raise Exception("day is missing a date")
+            days.append(Day(date=day, rooms=rooms))
+            rooms = []
+            day = None
+            root.clear()
+
+    if not conference:
+        raise Exception("could not find conference")
+
+    return Schedule(conference=conference, days=days)
+
+
+def iterparse(
+    source: Union[str, IO]
+) -> Tuple[Conference, Iterator[Tuple[date, str, Event]]]:
+    """
+    Stream parses a schedule written by `Schedule.to_xml`. The conference is read
+    straight away, while the returned iterator yields the day, room name and
+    event for each event in file order, only holding the current event in memory.
+    Rooms without any events are skipped.
+    """
+    context = ElementTree.iterparse(source, events=("start", "end"))
+    _, root = next(context)
+
+    for action, elem in context:
+        if action == "end" and elem.tag == "conference":
+            conference = _parse_conference(elem)
+            root.clear()
+            return conference, _iterparse_events(context, root)
+
+    raise Exception("could not find conference")
+
+
+def _iterparse_events(
+    context: Iterator[Tuple[str, ElementTree.Element]], root: ElementTree.Element
+) -> Iterator[Tuple[date, str, Event]]:
+    day: Optional[date] = None
+    room = ""
+    day_elem = root
+    room_elem = root
+    in_event = False
+
+    for action, elem in context:
+        if action == "start":
+            if elem.tag == "day":
+                day = date.fromisoformat(elem.attrib["date"])
+                day_elem = elem
+            elif elem.tag == "room" and not in_event:
+                room = elem.attrib["name"]
+                room_elem = elem
+            elif elem.tag == "event":
+                in_event = True
+            continue
+
+        if elem.tag == "event":
+            if day is None:
+                raise Exception("event outside of a day")
+            event = _parse_event(elem, day, room)
+            # Detach the event so a day with many sessions doesn't build up
+            room_elem.remove(elem)
+            in_event = False
+            yield day, room, event
+        elif elem.tag == "room" and not in_event:
+            day_elem.remove(elem)
+        elif elem.tag == "day":
+            root.clear()
+
+
+def _parse_conference(elem: ElementTree.Element) -> Conference:
+    return Conference(
+        title=elem.findtext("title") or "",
+        city=elem.findtext("city") or "",
+        venue=elem.findtext("venue") or "",
+        start=date.fromisoformat(elem.findtext("start") or ""),
+        end=date.fromisoformat(elem.findtext("end") or ""),
+    )
 
-        minutes = seconds // 60
-        seconds = seconds % 60
 
-        return f"{hours:02}:{minutes:02}"
+def _parse_event(elem: ElementTree.Element, day: date, room: str) -> Event:
+    start = datetime.strptime(elem.findtext("start") or "", "%H:%M")
+    return Event(
+        id=elem.attrib["id"],
+        start=datetime.combine(day, start.time()),
+        duration=pentabarf_parse_duration(elem.findtext("duration") or ""),
+        room=room,
+        title=elem.findtext("title") or "",
+        track=elem.findtext("track"),
+        description=elem.findtext("description") or "",
+        language=elem.findtext("language") or "",
+        persons=[p.text or "" for p in elem.iterfind("persons/person")],
+    )
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+import argparse
+import io
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+import bs4
+
+import devconf
+import merge
+import pentabarf
+import sessionize
+import synthetic
+
+
+def measure(fn: Callable[[], Any]) -> Tuple[Any, float, int]:
+    # Timed without tracemalloc, which slows allocation heavy code down a lot
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, seconds, peak
+
+
+def run(size: synthetic.Size, seed: int) -> Dict[str, Tuple[float, int]]:
+    conference = synthetic.generate(size, seed=seed)
+    results: Dict[str, Tuple[float, int]] = {}
+
+    def stage(name: str, fn: Callable[[], Any]) -> Any:
+        result, seconds, peak = measure(fn)
+        results[name] = (seconds, peak)
+        return result
+
+    event = stage("sessionize.Event", lambda: sessionize.Event(**conference.sessionize))
+    stage("sessionize.event_to_pentabarf", lambda: sessionize.event_to_pentabarf(event))
+    stage("sessionize.event_to_xcal", lambda: sessionize.event_to_xcal(event))
+
+    sessions_by_id = {session.id: session for session in event.sessions}
+    speakers_by_id = {speaker.id: speaker for speaker in event.speakers}
+    events: List[devconf.Event] = stage(
+        "devconf.parse_agenda",
+        lambda: [
+            devconf.parse_agenda(
+                bs4.BeautifulSoup(agenda.html, "html.parser"),
+                sessions_by_id,
+                speakers_by_id,
+                agenda.location,
+                agenda.day,
+            )
+            for agenda in conference.agendas
+        ],
+    )
+    schedules: List[pentabarf.Schedule] = stage(
+        "devconf.event_to_pentabarf",
+        lambda: [devconf.event_to_pentabarf(e) for e in events],
+    )
+    xml: List[str] = stage(
+        "pentabarf.Schedule.to_xml", lambda: [s.to_xml() for s in schedules]
+    )
+    stage("pentabarf.load", lambda: [pentabarf.load(io.StringIO(x)) for x in xml])
+
+    # Merge from files into a null sink so only the merge itself is measured
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        paths = []
+        for i, x in enumerate(xml):
+            path = os.path.join(tmp, f"{i}.pentabarf.xml")
+            with open(path, "w") as f:
+                f.write(x)
+            paths.append(path)
+
+        stage(
+            "merge.write_pentabarf",
+            lambda: merge.write_pentabarf(
+                [pentabarf.iterparse(path) for path in paths],
+                devnull,
+                title="DevConf",
+            ),
+        )
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Times each pipeline stage against synthetic conferences"
+    )
+    parser.add_argument(
+        "--sessions", type=int, nargs="+", default=[100, 1000, 5000, 10000, 20000]
+    )
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--rooms", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--csv", help="also write the raw measurements to a CSV file")
+    args = parser.parse_args()
+
+    rows: List[Tuple[int, str, float, int]] = []
+    for n in args.sessions:
+        # Add rooms rather than squeezing more than 24 timeslots into a day
+        rooms = max(args.rooms, math.ceil(n / args.days / 24))
+        size = synthetic.Size(
+            days=args.days, rooms=rooms, sessions=n, speakers=max(1, n * 2 // 3)
+        )
+        print(f"running {size}", file=sys.stderr)
+
+        for name, (seconds, peak) in run(size, args.seed).items():
+            rows.append((n, name, seconds, peak))
+
+    report(rows)
+
+    if args.csv:
+        with open(args.csv, "w") as f:
+            f.write("sessions,stage,seconds,peak_bytes\n")
+            for n, name, seconds, peak in rows:
+                f.write(f"{n},{name},{seconds:.6f},{peak}\n")
+
+
+def report(rows: List[Tuple[int, str, float, int]]) -> None:
+    width = 30
+    max_seconds = max(seconds for _, _, seconds, _ in rows) or 1
+    max_peak = max(peak for _, _, _, peak in rows) or 1
+
+    stages = list(dict.fromkeys(name for _, name, _, _ in rows))
+    for name in stages:
+        print(name)
+        for n, _, seconds, peak in (r for r in rows if r[1] == name):
+            time_bar = "#" * max(1, round(seconds / max_seconds * width))
+            peak_bar = "=" * max(1, round(peak / max_peak * width))
+            print(
+                f"  {n:>7} sessions {seconds:9.3f}s {time_bar:<{width}}"
+                f" {peak / 2**20:9.1f} MiB {peak_bar}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,6 @@ from xml.etree import ElementTree
 from pydantic import BaseModel
 
 import pentabarf
-from util import xcal_format_duration
 
 
 class Session(BaseModel):
@@ -95,7 +94,7 @@ def event_to_pentabarf(event: Event) -> pentabarf.Schedule:
                         duration=session.endsAt - session.startsAt,
                         room=r.name,
                         title=session.title,
-                        description=session.description,
+                        description=session.description.replace("\r\n", "\n"),
                         language="",
                         persons=[speakers_by_id[s].fullName for s in session.speakers],
                     )
@@ -144,25 +143,17 @@ def event_to_xcal(event: Event) -> str:
     version.text = "2.0"
 
     for session in event.sessions:
-        vevent = ElementTree.SubElement(vcalendar, "vevent")
-
-        ElementTree.SubElement(vevent, "uid").text = str(session.id)
-        ElementTree.SubElement(vevent, "dtstart").text = session.startsAt.strftime(
-            "%Y%m%dT%H%M%S"
-        )
-        ElementTree.SubElement(vevent, "dtend").text = session.endsAt.strftime(
-            "%Y%m%dT%H%M%S"
-        )
-        ElementTree.SubElement(vevent, "summary").text = session.title
-        ElementTree.SubElement(vevent, "description").text = session.description
-        ElementTree.SubElement(vevent, "location").text = rooms[session.roomId].name
-
-        ElementTree.SubElement(vevent, "duration").text = xcal_format_duration(
-            session.startsAt, session.endsAt
-        )
-
-        for speaker in session.speakers:
-            ElementTree.SubElement(vevent, "attendee").text = speakers[speaker].fullName
+        vevent = pentabarf.Event(
+            id=str(session.id),
+            start=session.startsAt,
+            duration=session.endsAt - session.startsAt,
+            room=rooms[session.roomId].name,
+            title=session.title,
+            description=session.description,
+            language="",
+            persons=[speakers[speaker].fullName for speaker in session.speakers],
+        ).to_vevent()
+        vcalendar.append(vevent)
 
     ElementTree.indent(root, space="\t", level=0)
     return ElementTree.tostring(root, encoding="unicode")
@@ -0,0 +1,277 @@
+import math
+import random
+import uuid
+from datetime import date, datetime, time, timedelta
+from html import escape
+from typing import Any, Dict, List, Tuple
+
+from pydantic import BaseModel
+
+ROOM_NAMES = [
+    "Amber",
+    "Amethyst",
+    "Emerald",
+    "Garnet",
+    "Jade",
+    "Onyx",
+    "Opal",
+    "Pearl",
+    "Ruby",
+    "Sapphire",
+    "Topaz",
+    "Turquoise",
+]
+
+FIRST_NAMES = ["Alex", "Busi", "Chris", "Dineo", "Jess", "Lwazi", "Pieter", "Thandi"]
+LAST_NAMES = ["Botha", "Dlamini", "Evans", "Khumalo", "Meyer", "Naidoo", "Smith"]
+WORDS = [
+    "async",
+    "cloud",
+    "data",
+    "design",
+    "devops",
+    "edge",
+    "functional",
+    "graphs",
+    "kubernetes",
+    "legacy",
+    "microservices",
+    "observability",
+    "performance",
+    "python",
+    "rust",
+    "security",
+    "serverless",
+    "testing",
+    "types",
+    "web",
+]
+
+DAY_START = time(8, 0)
+DAY_MINUTES = 16 * 60
+KEYNOTE_MINUTES = 45
+MIN_SLOT_MINUTES = 5
+MAX_SLOT_MINUTES = 45
+
+
+class Size(BaseModel):
+    days: int
+    rooms: int
+    sessions: int
+    speakers: int
+
+
+class Agenda(BaseModel):
+    location: str
+    day: date
+    html: str
+
+
+class Conference(BaseModel):
+    sessionize: Dict[str, Any]
+    agendas: List[Agenda]
+
+
+def generate(size: Size, seed: int = 0, start: date = date(2023, 5, 23)) -> Conference:
+    """
+    Generates a Sessionize `view/all` response and a matching devconf agenda page
+    per day. Every day opens with a keynote followed by timeslots that fill each
+    room, so `size.sessions` includes one keynote per day.
+    """
+    if size.days < 1 or size.rooms < 1 or size.speakers < 1:
+        raise ValueError("days, rooms and speakers must be positive")
+    if size.sessions < size.days:
+        raise ValueError("need at least one session (the keynote) per day")
+
+    rng = random.Random(seed)
+
+    rooms = [
+        {
+            "id": 1000 + i,
+            "name": _room_name(i),
+            "sort": i,
+        }
+        for i in range(size.rooms)
+    ]
+    speakers = [_speaker(rng) for _ in range(size.speakers)]
+
+    sessions: List[Dict[str, Any]] = []
+    agendas: List[Agenda] = []
+
+    for i in range(size.days):
+        day = start + timedelta(days=i)
+        # Spread the remainder over the first days
+        day_sessions = size.sessions // size.days + (
+            1 if i < size.sessions % size.days else 0
+        )
+        slots = math.ceil((day_sessions - 1) / size.rooms)
+        slot_minutes = MAX_SLOT_MINUTES
+        if slots:
+            slot_minutes = min(
+                MAX_SLOT_MINUTES, (DAY_MINUTES - KEYNOTE_MINUTES) // slots
+            )
+        if slot_minutes < MIN_SLOT_MINUTES:
+            raise ValueError(
+                f"{day_sessions} sessions do not fit in {size.rooms} rooms on one day"
+            )
+
+        starts_at = datetime.combine(day, DAY_START)
+        keynote = _session(
+            rng,
+            len(sessions),
+            rooms[0]["id"],
+            starts_at,
+            starts_at + timedelta(minutes=KEYNOTE_MINUTES),
+            speakers,
+        )
+        sessions.append(keynote)
+        rows = [_keynote_row(keynote)]
+
+        remaining = day_sessions - 1
+        starts_at += timedelta(minutes=KEYNOTE_MINUTES)
+        for slot in range(slots):
+            ends_at = starts_at + timedelta(minutes=slot_minutes)
+            slot_sessions: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+            for room in rooms[: min(size.rooms, remaining)]:
+                session = _session(
+                    rng, len(sessions), room["id"], starts_at, ends_at, speakers
+                )
+                sessions.append(session)
+                slot_sessions.append((session, room))
+            remaining -= len(slot_sessions)
+
+            rows.append(_timeslot_rows(slot_sessions, starts_at, ends_at))
+            if slot % 4 == 3:
+                rows.append(_break_row("Movement", ends_at, ends_at))
+            starts_at = ends_at
+
+        location = f"City {i + 1}"
+        agendas.append(
+            Agenda(
+                location=location,
+                day=day,
+                html=_agenda_html(f"{location} Convention Centre", rows),
+            )
+        )
+
+    return Conference(
+        sessionize={
+            "sessions": sessions,
+            "speakers": speakers,
+            "rooms": rooms,
+            "categories": [],
+            "questions": [],
+        },
+        agendas=agendas,
+    )
+
+
+def _room_name(i: int) -> str:
+    name = ROOM_NAMES[i % len(ROOM_NAMES)]
+    if i >= len(ROOM_NAMES):
+        name += f" {i // len(ROOM_NAMES) + 1}"
+    return name
+
+
+def _speaker(rng: random.Random) -> Dict[str, Any]:
+    first_name = rng.choice(FIRST_NAMES)
+    last_name = rng.choice(LAST_NAMES)
+    return {
+        "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "firstName": first_name,
+        "lastName": last_name,
+        "bio": _sentence(rng, 20),
+        "tagLine": _sentence(rng, 4),
+        "profilePicture": "",
+        "isTopSpeaker": False,
+        "links": [],
+        "sessions": [],
+        "fullName": f"{first_name} {last_name}",
+        "categoryItems": [],
+        "questionAnswers": [],
+    }
+
+
+def _session(
+    rng: random.Random,
+    index: int,
+    room_id: int,
+    starts_at: datetime,
+    ends_at: datetime,
+    speakers: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    _id = 100000 + index
+    session_speakers = rng.sample(speakers, min(len(speakers), rng.randint(1, 2)))
+    for speaker in session_speakers:
+        speaker["sessions"].append(_id)
+
+    return {
+        "id": _id,
+        "title": _sentence(rng, 5).title(),
+        "description": "\r\n".join(_sentence(rng, 25) for _ in range(3)),
+        "startsAt": starts_at.isoformat(),
+        "endsAt": ends_at.isoformat(),
+        "roomId": room_id,
+        "speakers": [speaker["id"] for speaker in session_speakers],
+    }
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _time_range(title: str, starts_at: datetime, ends_at: datetime) -> str:
+    return (
+        f"{starts_at.strftime('%Hh%M')} → {escape(title)} ← {ends_at.strftime('%Hh%M')}"
+    )
+
+
+def _keynote_row(session: Dict[str, Any]) -> str:
+    starts_at = datetime.fromisoformat(session["startsAt"])
+    ends_at = datetime.fromisoformat(session["endsAt"])
+    return (
+        '<div class="agenda-row agenda-row-style-keynote">'
+        f"{_time_range('Keynote', starts_at, ends_at)}"
+        f'<div class="agenda-keynote-session" data-slot-id="{session["id"]}"></div>'
+        "</div>"
+    )
+
+
+def _break_row(title: str, starts_at: datetime, ends_at: datetime) -> str:
+    return (
+        '<div class="agenda-row agenda-row-style-break">'
+        f"{_time_range(title, starts_at, ends_at)}"
+        "</div>"
+    )
+
+
+def _timeslot_rows(
+    sessions: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    starts_at: datetime,
+    ends_at: datetime,
+) -> str:
+    # The timeslot has to be the key row's immediate sibling, so no whitespace
+    cells = "".join(
+        f'<div class="agenda-session" data-slot-id="{session["id"]}">'
+        f'<h4>{escape(session["title"])}</h4>'
+        f'<div class="agenda-session-room">{escape(room["name"])}</div>'
+        "</div>"
+        for session, room in sessions
+    )
+    return (
+        '<div class="agenda-row agenda-row-style-key">'
+        f"{_time_range('Sessions', starts_at, ends_at)}"
+        "</div>"
+        f'<div class="agenda-row-timeslot">{cells}</div>'
+    )
+
+
+def _agenda_html(venue: str, rows: List[str]) -> str:
+    return (
+        "<html><body>"
+        '<div class="sponsor-content-detail-location">'
+        f"<a>{escape(venue)}</a>"
+        "</div>"
+        f'<div class="agenda">{"".join(rows)}</div>'
+        "</body></html>"
+    )
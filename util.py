@@ -1,4 +1,5 @@
-from datetime import datetime
+import re
+from datetime import datetime, timedelta
 
 
 def xcal_format_duration(start: datetime, end: datetime) -> str:
@@ -14,3 +15,22 @@ def xcal_format_duration(start: datetime, end: datetime) -> str:
     seconds = seconds % 60
 
     return f"{days}:{hours:02}:{minutes:02}:{seconds:02}"
+
+
+def pentabarf_format_duration(duration: timedelta) -> str:
+    seconds = int(duration.total_seconds())
+
+    hours = seconds // (60 * 60)
+    seconds = seconds % (60 * 60)
+
+    minutes = seconds // 60
+    seconds = seconds % 60
+
+    return f"{hours:02}:{minutes:02}"
+
+
+def pentabarf_parse_duration(duration: str) -> timedelta:
+    m = re.fullmatch(r"(\d+):(\d\d)", duration.strip())
+    if not m:
+        raise ValueError("invalid duration format")
+    return timedelta(hours=int(m.group(1)), minutes=int(m.group(2)))